@@ -1,14 +1,10 @@
 
 from utils.file_handler import read_sales_data, parse_transactions, validate_and_filter
-from utils.data_processor import (
-    calculate_total_revenue,
-    region_wise_sales,
-    top_selling_products,
-    customer_analysis,
-    daily_sales_trend,
-    find_peak_sales_day
-)
+from utils.data_processor import compute_all_stats
+import csv
 import os
+from itertools import islice
+from operator import itemgetter
 
 def main():
     print("==========================================")
@@ -48,25 +44,28 @@ def main():
     print("           ANALYTICS REPORT")
     print("==========================================\n")
 
+    # Single pass over the valid transactions feeds every section below
+    stats = compute_all_stats(valid_transactions, n=5)
+
     # 4.1 Total Revenue
-    revenue = calculate_total_revenue(valid_transactions)
+    revenue = stats.total_revenue
     print(f"1. Total Revenue: ${revenue:,.2f}")
 
     # 4.2 Region Analysis
     print("\n2. Sales by Region:")
-    region_stats = region_wise_sales(valid_transactions)
-    for region, stats in region_stats.items():
-        print(f"   - {region}: ${stats['total_sales']:,.2f} ({stats['percentage']}%) | {stats['transaction_count']} txns")
+    region_stats = stats.region_stats
+    for region, r_stats in region_stats.items():
+        print(f"   - {region}: ${r_stats['total_sales']:,.2f} ({r_stats['percentage']}%) | {r_stats['transaction_count']} txns")
 
     # 4.3 Top Products
     print("\n3. Top 5 Selling Products:")
-    top_products = top_selling_products(valid_transactions, n=5)
+    top_products = stats.top_products
     for i, (name, qty, rev) in enumerate(top_products, 1):
         print(f"   {i}. {name}: {qty} units sold (${rev:,.2f})")
 
     # 4.4 Peak Sales Day
     print("\n4. Peak Sales Day:")
-    peak_data = find_peak_sales_day(valid_transactions)
+    peak_data = stats.peak_day
     if peak_data:
         date, peak_rev, count = peak_data
         print(f"   - Date: {date}")
@@ -77,10 +76,10 @@ def main():
 
     # 4.5 Customer Insights (Top 3 Spenders)
     print("\n5. Top 3 Customers (by Spend):")
-    cust_stats = customer_analysis(valid_transactions)
-    top_3_customers = list(cust_stats.items())[:3]
-    for c_id, stats in top_3_customers:
-        print(f"   - {c_id}: ${stats['total_spent']:,.2f} (Bought {len(stats['products_bought'])} unique items)")
+    cust_stats = stats.customer_stats
+    top_3_customers = list(islice(cust_stats.items(), 3))
+    for c_id, c_stats in top_3_customers:
+        print(f"   - {c_id}: ${c_stats['total_spent']:,.2f} (Bought {len(c_stats['products_bought'])} unique items)")
 
     # --- Step 5: API Enrichment ---
     print("\n[INFO] Fetching real-time product data from API...")
@@ -88,7 +87,8 @@ def main():
     
     api_products = fetch_all_products()
     product_map = create_product_mapping(api_products)
-    print(f"[INFO] Created mapping for {len(product_map)} products.")
+    # product_map also holds a 'P<id>' alias per product, so count the source list
+    print(f"[INFO] Created mapping for {len(api_products)} products.")
     
     # Enrich transactions
     print("[INFO] Enriching transactions with API data...")
@@ -97,19 +97,17 @@ def main():
         # Create a copy to enrich
         enriched_t = t.copy()
         
-        # Logic to match ProductID to API ID
-        # Our data has 'P101', 'P102', etc. API has numeric IDs or strings '1', '2'.
-        # Attempt to strip 'P' and match, or match directly.
-        # This is a heuristic attempt.
-        pid_clean = t['ProductID'].replace('P', '')
-        
-        # Try finding in map assuming integer keys
-        matched_info = None
-        try:
-            pid_int = int(pid_clean)
-            matched_info = product_map.get(pid_int)
-        except ValueError:
-            matched_info = product_map.get(t['ProductID'])
+        # Match ProductID to API ID
+        # Our data has 'P101', 'P102', etc. API has numeric IDs; the mapping
+        # carries 'P<id>' aliases, so a single lookup does the usual match.
+        matched_info = product_map.get(t['ProductID'])
+        if matched_info is None:
+            # Other spellings (e.g. zero-padded 'P0101') fall back to the
+            # numeric match: strip 'P' and look up the integer ID
+            try:
+                matched_info = product_map.get(int(t['ProductID'].replace('P', '')))
+            except ValueError:
+                pass
             
         if matched_info:
             enriched_t.update(matched_info)
@@ -123,21 +121,31 @@ def main():
     enriched_file = 'output/enriched_sales_data.txt'
     print(f"[INFO] Saving enriched data to {enriched_file}...")
     os.makedirs(os.path.dirname(enriched_file), exist_ok=True)
-    with open(enriched_file, 'w', encoding='utf-8') as f:
+    # newline='' hands line endings to csv.writer, as the csv docs require
+    with open(enriched_file, 'w', encoding='utf-8', newline='') as f:
         # Write Header
         # Base keys + new keys from API
         if enriched_transactions:
             keys = list(enriched_transactions[0].keys())
-            f.write('|'.join(keys) + '\n')
+            # csv.writer formats and joins the fields in C; itemgetter pulls
+            # the row values in one call, falling back to a per-key .get()
+            # only for rows missing some of the header's keys
+            writer = csv.writer(f, delimiter='|', lineterminator='\n')
+            writer.writerow(keys)
+            write_row = writer.writerow
+            row_values = itemgetter(*keys)
             for t in enriched_transactions:
-                values = [str(t.get(k, '')) for k in keys]
-                f.write('|'.join(values) + '\n')
+                try:
+                    write_row(row_values(t))
+                except KeyError:
+                    write_row([t.get(k, '') for k in keys])
 
     # --- Step 6: Report Generation ---
+    # Reuse the analytics computed in Step 4 rather than recomputing them
     print("\n[INFO] Generating comprehensive report...")
     from utils.data_processor import generate_sales_report
     output_report_path = 'output/sales_report.txt'
-    generate_sales_report(valid_transactions, enriched_transactions, output_report_path)
+    generate_sales_report(valid_transactions, enriched_transactions, output_report_path, stats=stats)
 
     print("\n==========================================")
     print("           System Finished")
@@ -17,6 +17,11 @@ def test_assignment_part1():
     # Basic check on first line
     print(f"First line sample: {raw_lines[0]}")
     
+    # 1b. Test concurrent multi-file read
+    from utils.file_handler import read_sales_data_many
+    many = read_sales_data_many([filename, filename])
+    assert many == [raw_lines, raw_lines], "read_sales_data_many should match read_sales_data per file"
+    
     # 2. Test Parse
     print(f"\n2. Testing parse_transactions...")
     transactions = parse_transactions(raw_lines)
@@ -34,6 +39,18 @@ def test_assignment_part1():
             if "," in t['ProductName']:
                 print(f"WARNING: Comma found in ProductName: {t['ProductName']}")
                 
+    # 2b. Test the multi-process parse path against a serial parse
+    from utils import file_handler
+    real_min_lines = file_handler._PARALLEL_MIN_LINES
+    file_handler._PARALLEL_MIN_LINES = 1
+    try:
+        parallel_transactions = parse_transactions(raw_lines, workers=2)
+    finally:
+        file_handler._PARALLEL_MIN_LINES = real_min_lines
+    assert parallel_transactions == transactions, "Parallel parse should match the serial parse"
+    from sys import intern
+    assert all(t['Region'] is intern(t['Region']) for t in parallel_transactions), "Parallel parse should keep values interned"
+    
     # 3. Test Validation and Filtering
     print(f"\n3. Testing validate_and_filter...")
     
@@ -48,6 +65,15 @@ def test_assignment_part1():
     for t in valid_north:
         assert t['Region'] == 'North', "Region filter failed"
         
+    # Test 3b-2: Filter by several regions at once
+    print("\nApplying Region={'North', 'East'}...")
+    valid_ne, invalid_ne, summary_ne = validate_and_filter(transactions, region={'North', 'East'})
+    print(f"North+East Filter Summary: {summary_ne}")
+    for t in valid_ne:
+        assert t['Region'] in ('North', 'East'), "Multi-region filter failed"
+    valid_east, _, _ = validate_and_filter(transactions, region='East')
+    assert len(valid_ne) == len(valid_north) + len(valid_east), "Multi-region filter count mismatch"
+        
     # Test 3c: Filter by Min Amount 5000
     print("\nApplying MinAmount=5000...")
     valid_high, invalid_high, summary_high = validate_and_filter(transactions, min_amount=5000)
@@ -55,6 +81,15 @@ def test_assignment_part1():
     for t in valid_high:
         assert t['Quantity'] * t['UnitPrice'] >= 5000, "Min amount filter failed"
 
+    # Test 3d: Reusing one validation result across filter views
+    from utils.file_handler import validate_transactions
+    validation = validate_transactions(transactions)
+    valid_north_2, _, summary_north_2 = validate_and_filter(transactions, region='North', validation=validation)
+    assert valid_north_2 == valid_north and summary_north_2 == summary_north, "Reused validation result mismatch"
+    
+    # validate_transactions reads its input once, so an iterator gives the same result
+    assert validate_transactions(iter(transactions)) == validation, "Iterator input should validate like the list"
+
     # === PART 2 TESTS ===
     from utils.data_processor import (
         calculate_total_revenue, 
@@ -107,6 +142,12 @@ def test_assignment_part1():
         # Verify sorting (descending spend)
         spends = [d['total_spent'] for d in cust_stats.values()]
         assert spends == sorted(spends, reverse=True), "Customer stats not sorted by spend"
+
+        # top_customers must agree with the head of the full ranking
+        from utils.data_processor import top_customers
+        top_3 = top_customers(analysis_data, n=3)
+        print(f"Top 3 Customers: {[c_id for c_id, _ in top_3]}")
+        assert top_3 == list(cust_stats.items())[:3], "top_customers disagrees with customer_analysis"
         
     # 8. Test Daily Trend
     print("\n8. Testing daily_sales_trend...")
@@ -135,6 +176,18 @@ def test_assignment_part1():
 
         assert peak_day[1] == max_rev, "Returned revenue matches calculated max"
 
+    # 9b. Test the single-pass compute_all_stats against the individual functions
+    from utils.data_processor import compute_all_stats
+    print("\n9b. Testing compute_all_stats...")
+    all_stats = compute_all_stats(analysis_data, n=3)
+    assert all_stats.total_revenue == total_revenue, "Fused total revenue mismatch"
+    assert all_stats.region_stats == region_stats, "Fused region stats mismatch"
+    assert all_stats.top_products == top_products, "Fused top products mismatch"
+    assert list(all_stats.customer_stats) == list(cust_stats), "Fused customer ranking mismatch"
+    assert all_stats.daily_stats == daily_stats, "Fused daily stats mismatch"
+    assert all_stats.peak_day == peak_day, "Fused peak day mismatch"
+    print("compute_all_stats matches the individual analyses.")
+
     # === PART 3 TESTS ===
     from utils.api_handler import fetch_all_products, create_product_mapping
     print("\n--- Part 3: API Integration Tests ---")
@@ -152,7 +205,8 @@ def test_assignment_part1():
         # 11. Test Product Mapping
         print("\n11. Testing create_product_mapping...")
         product_map = create_product_mapping(api_products)
-        print(f"Mapped {len(product_map)} products.")
+        # Each product is keyed by its ID and by its 'P<id>' alias
+        print(f"Mapped {len(api_products)} products.")
         
         first_id = list(product_map.keys())[0]
         mapped_item = product_map[first_id]
@@ -160,11 +214,32 @@ def test_assignment_part1():
         
         assert 'title' in mapped_item, "Mapped item should have title"
         assert 'rating' in mapped_item, "Mapped item should have rating"
+        assert product_map.get(f"P{first_id}") is mapped_item, "Sales-data 'P<id>' alias should map to the same info"
     else:
         print("WARNING: API fetch returned empty. Check internet connection or API status.")
         # We don't fail the test here because network issues can happen, 
         # allowing the script to pass "conceptually" is verified by the try-except block design.
 
+    # 10b. A malformed (non-JSON) response body is reported, not raised
+    print("\n10b. Testing fetch_all_products with a malformed response...")
+    from utils import api_handler
+    
+    class _HTMLResponse:
+        content = b'<html>502</html>'
+        def raise_for_status(self):
+            pass
+            
+    class _HTMLSession:
+        def get(self, *args, **kwargs):
+            return _HTMLResponse()
+            
+    real_session = api_handler._session
+    api_handler._session = lambda: _HTMLSession()
+    try:
+        assert fetch_all_products(force_refresh=True) == [], "Malformed body should yield an empty product list"
+    finally:
+        api_handler._session = real_session
+
     # === PART 4 TESTS ===
     from utils.data_processor import generate_sales_report
     import os
@@ -192,6 +267,16 @@ def test_assignment_part1():
     else:
         print("Error: Report file was not created.")
         assert False, "Report file missing"
+        
+    # 12b. A caller's precomputed stats (here ranked with n=3) give the same report
+    def _report_body(path):
+        with open(path, 'r') as f:
+            return [line for line in f if "Generated:" not in line]
+            
+    stats_output = 'output/test_report_stats.txt'
+    generate_sales_report(analysis_data, mock_enriched, stats_output, stats=all_stats)
+    assert _report_body(stats_output) == _report_body(test_output), "Report differs when stats are passed in"
+    os.remove(stats_output)
 
     print("\n=== All Tests Passed (conceptually) ===")
 
@@ -1,24 +1,189 @@
 
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import requests
 
-def fetch_all_products():
+# orjson is an optional, much faster drop-in for parsing and dumping JSON
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    # json.loads accepts bytes too; encode dumps output to match orjson
+    _json_loads = json.loads
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+PRODUCTS_URL = "https://dummyjson.com/products"
+PAGE_SIZE = 100
+MAX_WORKERS = 8
+
+# Local copy of the catalog so repeated runs can skip the network
+CACHE_FILE = os.path.join('cache', 'products.json')
+CACHE_TTL_SECONDS = 3600
+
+# One session per thread: keep-alive lets page fetches reuse pooled
+# TCP/TLS connections instead of reconnecting each time, and requests
+# does not promise that a Session is safe to share between threads
+_thread_state = threading.local()
+
+def _session():
     """
-    Fetches all products from DummyJSON API
+    Returns this thread's requests session, creating it on first use
+    """
+    session = getattr(_thread_state, 'session', None)
+    if session is None:
+        session = _thread_state.session = requests.Session()
+        session.headers.update({'Accept': 'application/json'})
+    return session
+
+class _IncompleteCatalog(Exception):
+    """
+    Raised when a page after the first fails to download
     
-    Returns: list of product dictionaries
+    Carries the products fetched before the failure (in offset order)
+    and the underlying request error.
+    """
+    def __init__(self, products, error):
+        super().__init__(str(error))
+        self.products = products
+        self.error = error
+
+def _fetch_page(skip):
+    """
+    Fetches one page of products starting at offset skip
+
+    Returns: decoded JSON payload (dict with 'products' and 'total')
     """
-    url = "https://dummyjson.com/products?limit=100"
+    response = _session().get(
+        PRODUCTS_URL,
+        params={'limit': PAGE_SIZE, 'skip': skip},
+        timeout=10 # 10s timeout is good practice
+    )
+    response.raise_for_status() # Raise API errors
     
+    # Parse the raw body directly, skipping the bytes -> str decode step
     try:
-        response = requests.get(url, timeout=10) # 10s timeout is good practice
-        response.raise_for_status() # Raise API errors
-        
-        data = response.json()
-        products = data.get('products', [])
+        return _json_loads(response.content)
+    except ValueError as e:
+        # orjson/json decode errors are plain ValueErrors; re-raise as the
+        # requests error response.json() gave, so a non-JSON body is still
+        # handled as a failed request
+        raise requests.exceptions.InvalidJSONError(f"Invalid JSON in response: {e}", response=response) from e
+
+def _read_cached_products():
+    """
+    Loads the product list from the local cache file if it is still fresh
+    
+    Returns: list of product dictionaries, or None when missing/stale/unreadable
+    """
+    try:
+        if time.time() - os.path.getmtime(CACHE_FILE) >= CACHE_TTL_SECONDS:
+            return None
+        with open(CACHE_FILE, 'rb') as f:
+            return _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+def _write_cached_products(products):
+    """
+    Saves the product list to the local cache file
+    
+    Writes to a temp file and renames it over the cache, so a crash
+    mid-write never leaves a truncated cache behind.
+    """
+    tmp_file = CACHE_FILE + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            f.write(_json_dumps(products))
+        os.replace(tmp_file, CACHE_FILE)
+    except OSError as e:
+        # The cache is only an optimization; never fail the fetch over it
+        print(f"Warning: could not write product cache: {e}")
+
+def _download_catalog():
+    """
+    Downloads the whole catalog, fetching the remaining pages concurrently
+    
+    A failure on the first page propagates as is. A failure on a later
+    page raises _IncompleteCatalog carrying the pages fetched before it.
+
+    Returns: list of product dictionaries
+    """
+    # The first page also reports how many products exist in total
+    first_page = _fetch_page(0)
+    products = list(first_page.get('products', []))
+    total = first_page.get('total', len(products))
+    
+    # Step by the page size the server actually returned, in case it
+    # caps 'limit' below PAGE_SIZE; an empty first page means no more
+    page_size = len(products)
+    remaining_skips = range(page_size, total, page_size) if page_size else range(0)
+    if remaining_skips:
+        # Keep several requests in flight so round-trip latency overlaps;
+        # map() yields pages in offset order
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(remaining_skips))) as executor:
+            try:
+                for page in executor.map(_fetch_page, remaining_skips):
+                    products.extend(page.get('products', []))
+            except requests.exceptions.RequestException as e:
+                raise _IncompleteCatalog(products, e) from e
+                
+    return products
+
+@lru_cache(maxsize=1)
+def _load_catalog(use_disk_cache=True):
+    """
+    Returns the catalog from the on-disk cache, or the API when that is stale
+    
+    Memoized for the life of the process. Errors propagate (and so are
+    not cached), letting a later call retry.
+
+    Returns: tuple of product dictionaries
+    """
+    if use_disk_cache:
+        products = _read_cached_products()
+        if products is not None:
+            print(f"Loaded {len(products)} products from cache ({CACHE_FILE}).")
+            return tuple(products)
+            
+    products = _download_catalog()
+    print(f"Successfully fetched {len(products)} products from API.")
+    _write_cached_products(products)
+    
+    return tuple(products)
+
+def fetch_all_products(force_refresh=False):
+    """
+    Fetches all products from DummyJSON API
+    
+    Results are cached on disk for CACHE_TTL_SECONDS and in memory for the
+    rest of the process. Pass force_refresh=True to bypass both caches.
+    If a page after the first fails, the products fetched before it are
+    returned (and not cached); if the first page fails, an empty list.
+    
+    Returns: list of product dictionaries
+    """
+    if force_refresh:
+        _load_catalog.cache_clear()
         
-        print(f"Successfully fetched {len(products)} products from API.")
-        return products
+    try:
+        return list(_load_catalog(use_disk_cache=not force_refresh))
         
+    except _IncompleteCatalog as e:
+        print(f"Error fetching products: {e.error}")
+        print(f"Warning: returning the {len(e.products)} products fetched before the error.")
+        return list(e.products)
     except requests.exceptions.RequestException as e:
         print(f"Error fetching products: {e}")
         return []
@@ -30,18 +195,26 @@ def create_product_mapping(api_products):
     Parameters: api_products from fetch_all_products()
     
     Returns: dictionary mapping product IDs to info
-    Format: { id: { 'title': ..., 'category': ..., 'brand': ..., 'rating': ... }, ... }
+    Format: { id: { 'title': ..., 'category': ..., 'brand': ..., 'rating': ... },
+              'P<id>': <the same info dict>, ... }
+    Each product is keyed by its integer API ID and by the sales-data
+    form ('P101'), so the mapping holds two keys per product. The alias
+    covers canonical sales-data IDs only; zero-padded forms such as
+    'P0101' still need normalizing to the integer ID.
     """
     mapping = {}
     
     for p in api_products:
         p_id = p.get('id')
         if p_id is not None:
-            mapping[p_id] = {
+            info = {
                 'title': p.get('title'),
                 'category': p.get('category'),
                 'brand': p.get('brand'),
                 'rating': p.get('rating')
             }
+            mapping[p_id] = info
+            # The alias shares the same info dict
+            mapping[f'P{p_id}'] = info
             
     return mapping
@@ -1,6 +1,34 @@
 
+import heapq
 import os
+from collections import defaultdict, namedtuple
 from datetime import datetime
+from itertools import islice
+from operator import itemgetter
+
+# Each aggregation pulls the fields it needs out of a transaction with one
+# C-level itemgetter call instead of a separate dict subscript per field.
+_REGION_FIELDS = itemgetter('Region', 'Quantity', 'UnitPrice')
+_PRODUCT_FIELDS = itemgetter('ProductName', 'Quantity', 'UnitPrice')
+_CUSTOMER_FIELDS = itemgetter('CustomerID', 'Quantity', 'UnitPrice', 'ProductName')
+_DAILY_FIELDS = itemgetter('Date', 'Quantity', 'UnitPrice', 'CustomerID')
+_PEAK_FIELDS = itemgetter('Date', 'Quantity', 'UnitPrice')
+
+# Fresh accumulators for the defaultdicts used by the aggregations.
+# They are lists rather than dicts: a slot update (stats[0] += amount) is
+# far cheaper than hashing a field name on every row. The documented dict
+# shapes are only built once per group, in the _finalize helpers.
+def _new_region_entry():
+    return [0.0, 0] # [total_sales, transaction_count]
+
+def _new_product_entry():
+    return [0, 0.0] # [quantity, revenue]
+
+def _new_customer_entry():
+    return [0.0, 0, set()] # [total_spent, purchase_count, products_set]
+
+def _new_daily_entry():
+    return [0.0, 0, set()] # [revenue, transaction_count, customers_set]
 
 def calculate_total_revenue(transactions):
     """
@@ -8,43 +36,37 @@ def calculate_total_revenue(transactions):
     
     Returns: float (total revenue)
     """
-    total_revenue = sum(t['Quantity'] * t['UnitPrice'] for t in transactions)
+    # Summing a list comprehension skips the generator resume that
+    # sum(<genexpr>) pays on every row, at the cost of a temporary list
+    # of one float per row
+    total_revenue = sum([t['Quantity'] * t['UnitPrice'] for t in transactions])
     return total_revenue
 
-def region_wise_sales(transactions):
+def _finalize_region_stats(region_stats):
     """
-    Analyzes sales by region
+    Adds percentages and rounding to raw per-region aggregates
     
-    Returns: dictionary with region statistics
-    Format: {
-        'North': {'total_sales': float, 'transaction_count': int, 'percentage': float},
-        ...
-    }
+    Parameters: region_stats mapping region -> [total_sales, transaction_count]
+
+    Returns: dictionary sorted by total_sales descending
     """
-    region_stats = {}
-    total_revenue = calculate_total_revenue(transactions)
+    # The grand total falls out of the per-region sums (a handful of
+    # regions), so no separate calculate_total_revenue pass is needed.
+    # Deriving it here gives every caller the same float denominator.
+    total_revenue = sum(stats[0] for stats in region_stats.values())
     
     if total_revenue == 0:
         return {}
 
-    # Aggregate data
-    for t in transactions:
-        region = t['Region']
-        amount = t['Quantity'] * t['UnitPrice']
-        
-        if region not in region_stats:
-            region_stats[region] = {'total_sales': 0.0, 'transaction_count': 0}
-            
-        region_stats[region]['total_sales'] += amount
-        region_stats[region]['transaction_count'] += 1
-        
     # Calculate percentage and format
     final_stats = {}
-    for region, stats in region_stats.items():
-        percentage = (stats['total_sales'] / total_revenue) * 100
-        stats['percentage'] = round(percentage, 2)
-        stats['total_sales'] = round(stats['total_sales'], 2) # rounding for cleanliness
-        final_stats[region] = stats
+    for region, (total_sales, transaction_count) in region_stats.items():
+        percentage = (total_sales / total_revenue) * 100
+        final_stats[region] = {
+            'total_sales': round(total_sales, 2), # rounding for cleanliness
+            'transaction_count': transaction_count,
+            'percentage': round(percentage, 2)
+        }
         
     # Sort by total_sales descending
     # Dictionary insertion order is preserved in modern Python (3.7+)
@@ -52,6 +74,50 @@ def region_wise_sales(transactions):
     
     return sorted_stats
 
+def region_wise_sales(transactions):
+    """
+    Analyzes sales by region
+    
+    Returns: dictionary with region statistics
+    Format: {
+        'North': {'total_sales': float, 'transaction_count': int, 'percentage': float},
+        ...
+    }
+    """
+    region_stats = defaultdict(_new_region_entry)
+
+    # Aggregate data
+    for region, qty, price in map(_REGION_FIELDS, transactions):
+        amount = qty * price
+        
+        # defaultdict creates the entry on first sight: one hash probe per row
+        stats = region_stats[region]
+        stats[0] += amount
+        stats[1] += 1
+        
+    return _finalize_region_stats(region_stats)
+
+def _product_list(product_stats):
+    """
+    Flattens raw per-product aggregates, keeping first-seen order
+    
+    Parameters: product_stats mapping name -> [quantity, revenue]
+
+    Returns: list of tuples [('ProductName', TotalQuantity, TotalRevenue), ...]
+    """
+    return [
+        (name, quantity, revenue) 
+        for name, (quantity, revenue) in product_stats.items()
+    ]
+
+def _rank_products(product_list, n):
+    """
+    Returns the top n entries of a product list by quantity
+    """
+    # Top n by TotalQuantity descending; nlargest keeps only n items in its
+    # heap instead of sorting every product (ties keep first-seen order)
+    return heapq.nlargest(n, product_list, key=lambda x: x[1])
+
 def top_selling_products(transactions, n=5):
     """
     Finds top n products by total quantity sold
@@ -59,29 +125,65 @@ def top_selling_products(transactions, n=5):
     Returns: list of tuples
     Format: [('ProductName', TotalQuantity, TotalRevenue), ...]
     """
-    product_stats = {}
+    product_stats = defaultdict(_new_product_entry)
     
-    for t in transactions:
-        p_name = t['ProductName']
-        qty = t['Quantity']
-        revenue = qty * t['UnitPrice']
+    for p_name, qty, price in map(_PRODUCT_FIELDS, transactions):
+        revenue = qty * price
         
-        if p_name not in product_stats:
-            product_stats[p_name] = {'quantity': 0, 'revenue': 0.0}
-            
-        product_stats[p_name]['quantity'] += qty
-        product_stats[p_name]['revenue'] += revenue
+        stats = product_stats[p_name]
+        stats[0] += qty
+        stats[1] += revenue
         
-    # Convert to list of tuples
-    product_list = [
-        (name, data['quantity'], data['revenue']) 
-        for name, data in product_stats.items()
-    ]
+    return _rank_products(_product_list(product_stats), n)
+
+def _customer_entry(total_spent, purchase_count, products_set):
+    """
+    Builds the documented per-customer dict from raw aggregates
+    """
+    avg_value = total_spent / purchase_count if purchase_count > 0 else 0
+    
+    return {
+        'total_spent': round(total_spent, 2),
+        'purchase_count': purchase_count,
+        'avg_order_value': round(avg_value, 2),
+        'products_bought': list(products_set) # convert set back to list
+    }
+
+def _finalize_customer_stats(customer_stats):
+    """
+    Converts raw per-customer aggregates into the documented format
+    
+    Parameters: customer_stats mapping c_id -> [total_spent, purchase_count, products_set]
+
+    Returns: dictionary sorted by total_spent descending
+    """
+    # Calculate avg and finalize structure
+    final_stats = {}
+    for c_id, (total_spent, purchase_count, products_set) in customer_stats.items():
+        final_stats[c_id] = _customer_entry(total_spent, purchase_count, products_set)
+        
+    # Sort by total_spent descending
+    sorted_stats = dict(sorted(final_stats.items(), key=lambda item: item[1]['total_spent'], reverse=True))
     
-    # Sort by TotalQuantity descending
-    product_list.sort(key=lambda x: x[1], reverse=True)
+    return sorted_stats
+
+def _aggregate_customers(transactions):
+    """
+    Accumulates raw per-customer totals
+
+    Returns: dictionary mapping c_id -> [total_spent, purchase_count, products_set]
+    """
+    customer_stats = defaultdict(_new_customer_entry)
     
-    return product_list[:n]
+    for c_id, qty, price, p_name in map(_CUSTOMER_FIELDS, transactions):
+        amount = qty * price
+        
+        stats = customer_stats[c_id]
+        stats[0] += amount
+        stats[1] += 1
+        stats[2].add(p_name) # using set for unique products
+        
+    return customer_stats
 
 def customer_analysis(transactions):
     """
@@ -97,38 +199,42 @@ def customer_analysis(transactions):
         }, ...
     }
     """
-    customer_stats = {}
+    return _finalize_customer_stats(_aggregate_customers(transactions))
+
+def top_customers(transactions, n=5):
+    """
+    Finds the top n customers by total spend without sorting every customer
     
-    for t in transactions:
-        c_id = t['CustomerID']
-        amount = t['Quantity'] * t['UnitPrice']
-        p_name = t['ProductName']
-        
-        if c_id not in customer_stats:
-            customer_stats[c_id] = {
-                'total_spent': 0.0,
-                'purchase_count': 0,
-                'products_set': set() # using set for unique products
-            }
-            
-        customer_stats[c_id]['total_spent'] += amount
-        customer_stats[c_id]['purchase_count'] += 1
-        customer_stats[c_id]['products_set'].add(p_name)
-        
-    # Calculate avg and finalize structure
+    Returns: list of tuples, same as list(customer_analysis(...).items())[:n]
+    Format: [('C001', {'total_spent': float, ...}), ...]
+    """
+    customer_stats = _aggregate_customers(transactions)
+    
+    # Rank on the rounded spend, as customer_analysis does, so ties resolve
+    # identically; only the n winners are converted to the documented format
+    top = heapq.nlargest(n, customer_stats.items(), key=lambda item: round(item[1][0], 2))
+    
+    return [(c_id, _customer_entry(*stats)) for c_id, stats in top]
+
+def _finalize_daily_stats(daily_stats):
+    """
+    Converts raw per-date aggregates into the documented format
+    
+    Parameters: daily_stats mapping date -> [revenue, transaction_count, customers_set]
+
+    Returns: dictionary sorted by date ascending
+    """
+    # Finalize stats
     final_stats = {}
-    for c_id, stats in customer_stats.items():
-        avg_value = stats['total_spent'] / stats['purchase_count'] if stats['purchase_count'] > 0 else 0
-        
-        final_stats[c_id] = {
-            'total_spent': round(stats['total_spent'], 2),
-            'purchase_count': stats['purchase_count'],
-            'avg_order_value': round(avg_value, 2),
-            'products_bought': list(stats['products_set']) # convert set back to list
+    for date, (revenue, transaction_count, customers_set) in daily_stats.items():
+        final_stats[date] = {
+            'revenue': round(revenue, 2),
+            'transaction_count': transaction_count,
+            'unique_customers': len(customers_set)
         }
         
-    # Sort by total_spent descending
-    sorted_stats = dict(sorted(final_stats.items(), key=lambda item: item[1]['total_spent'], reverse=True))
+    # Sort by Date ascending
+    sorted_stats = dict(sorted(final_stats.items(), key=lambda item: item[0]))
     
     return sorted_stats
 
@@ -145,46 +251,24 @@ def daily_sales_trend(transactions):
         }, ...
     }
     """
-    daily_stats = {}
+    daily_stats = defaultdict(_new_daily_entry)
     
-    for t in transactions:
-        date = t['Date']
-        amount = t['Quantity'] * t['UnitPrice']
-        c_id = t['CustomerID']
+    for date, qty, price, c_id in map(_DAILY_FIELDS, transactions):
+        amount = qty * price
         
-        if date not in daily_stats:
-            daily_stats[date] = {
-                'revenue': 0.0, 
-                'transaction_count': 0, 
-                'customers_set': set()
-            }
-            
-        daily_stats[date]['revenue'] += amount
-        daily_stats[date]['transaction_count'] += 1
-        daily_stats[date]['customers_set'].add(c_id)
-        
-    # Finalize stats
-    final_stats = {}
-    for date, stats in daily_stats.items():
-        final_stats[date] = {
-            'revenue': round(stats['revenue'], 2),
-            'transaction_count': stats['transaction_count'],
-            'unique_customers': len(stats['customers_set'])
-        }
+        stats = daily_stats[date]
+        stats[0] += amount
+        stats[1] += 1
+        stats[2].add(c_id)
         
-    # Sort by Date ascending
-    sorted_stats = dict(sorted(final_stats.items(), key=lambda item: item[0]))
-    
-    return sorted_stats
+    return _finalize_daily_stats(daily_stats)
 
-def find_peak_sales_day(transactions):
+def _peak_from_daily_stats(daily_stats):
     """
-    Identifies the date with highest revenue
-    
-    Returns: tuple (date, revenue, transaction_count)
+    Picks the highest-revenue day out of daily_sales_trend() output
+
+    Returns: tuple (date, revenue, transaction_count) or None
     """
-    daily_stats = daily_sales_trend(transactions)
-    
     if not daily_stats:
         return None
         
@@ -198,121 +282,229 @@ def find_peak_sales_day(transactions):
     
     return (date, revenue, count)
 
-def generate_sales_report(transactions, enriched_transactions, output_file='output/sales_report.txt'):
+def find_peak_sales_day(transactions, daily_stats=None):
     """
-    Generates a comprehensive formatted text report
-    """
-    # Ensure output directory exists
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    Identifies the date with highest revenue
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        # 1. HEADER
-        f.write("==========================================\n")
-        f.write("          SALES ANALYTICS REPORT\n")
-        f.write(f"          Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"          Records Processed: {len(transactions)}\n")
-        f.write("==========================================\n\n")
-        
-        # 2. OVERALL SUMMARY
-        total_revenue = calculate_total_revenue(transactions)
-        total_transactions = len(transactions)
-        avg_order_value = total_revenue / total_transactions if total_transactions > 0 else 0
-        
-        dates = [t['Date'] for t in transactions]
-        date_range = f"{min(dates)} to {max(dates)}" if dates else "N/A"
-        
-        f.write("OVERALL SUMMARY\n")
-        f.write("------------------------------------------\n")
-        f.write(f"Total Revenue:       ${total_revenue:,.2f}\n")
-        f.write(f"Total Transactions:  {total_transactions}\n")
-        f.write(f"Average Order Value: ${avg_order_value:,.2f}\n")
-        f.write(f"Date Range:          {date_range}\n\n")
-        
-        # 3. REGION-WISE PERFORMANCE
-        f.write("REGION-WISE PERFORMANCE\n")
-        f.write("------------------------------------------\n")
-        f.write(f"{'Region':<15} {'Sales':<15} {'% of Total':<15} {'Transactions':<15}\n")
-        region_stats = region_wise_sales(transactions)
-        for region, stats in region_stats.items():
-            f.write(f"{region:<15} ${stats['total_sales']:<14,.2f} {stats['percentage']:<14}% {stats['transaction_count']:<15}\n")
-        f.write("\n")
-        
-        # 4. TOP 5 PRODUCTS
-        f.write("TOP 5 PRODUCTS\n")
-        f.write("------------------------------------------\n")
-        f.write(f"{'Rank':<5} {'Product Name':<30} {'Quantity':<10} {'Revenue':<15}\n")
-        top_products = top_selling_products(transactions, n=5)
-        for i, (name, qty, rev) in enumerate(top_products, 1):
-            f.write(f"{i:<5} {name:<30} {qty:<10} ${rev:<15,.2f}\n")
-        f.write("\n")
-        
-        # 5. TOP 5 CUSTOMERS
-        f.write("TOP 5 CUSTOMERS\n")
-        f.write("------------------------------------------\n")
-        f.write(f"{'Rank':<5} {'Customer ID':<15} {'Total Spent':<20} {'Order Count':<10}\n")
-        cust_stats = customer_analysis(transactions)
-        top_customers = list(cust_stats.items())[:5]
-        for i, (c_id, stats) in enumerate(top_customers, 1):
-            f.write(f"{i:<5} {c_id:<15} ${stats['total_spent']:<19,.2f} {stats['purchase_count']:<10}\n")
-        f.write("\n")
-        
-        # 6. DAILY SALES TREND
-        f.write("DAILY SALES TREND\n")
-        f.write("------------------------------------------\n")
-        f.write(f"{'Date':<15} {'Revenue':<20} {'Transactions':<15} {'Unique Customers':<20}\n")
-        daily_stats = daily_sales_trend(transactions)
-        for date, stats in daily_stats.items():
-            f.write(f"{date:<15} ${stats['revenue']:<19,.2f} {stats['transaction_count']:<14} {stats['unique_customers']:<20}\n")
-        f.write("\n")
+    Parameters: daily_stats - optional daily_sales_trend() output the caller
+    already has; when given, transactions are not scanned again
+    
+    Returns: tuple (date, revenue, transaction_count)
+    """
+    if daily_stats is not None:
+        return _peak_from_daily_stats(daily_stats)
         
-        # 7. PRODUCT PERFORMANCE ANALYSIS
-        f.write("PRODUCT PERFORMANCE ANALYSIS\n")
-        f.write("------------------------------------------\n")
+    # Only revenue and count per date are needed here, so skip the
+    # per-day customer sets that daily_sales_trend builds
+    revenue = defaultdict(float)
+    count = defaultdict(int)
+    
+    for date, qty, price in map(_PEAK_FIELDS, transactions):
+        revenue[date] += qty * price
+        count[date] += 1
         
-        # Best selling day
-        peak = find_peak_sales_day(transactions)
-        best_day_str = f"{peak[0]} (${peak[1]:,.2f} with {peak[2]} txns)" if peak else "N/A"
-        f.write(f"Best Selling Day: {best_day_str}\n")
+    if not revenue:
+        return None
         
-        # Low performing products (bottom 3)
-        # Using logic similar to top_selling but taking bottom
-        product_sales = {}
-        for t in transactions:
-            pid = t['ProductName']
-            product_sales[pid] = product_sales.get(pid, 0) + t['Quantity']
-        sorted_products = sorted(product_sales.items(), key=lambda x: x[1])
-        low_performers = sorted_products[:3]
-        f.write("Low Performing Products (Bottom 3 by Qty):\n")
-        for name, qty in low_performers:
-            f.write(f"  - {name}: {qty} units\n")
-            
-        # Avg transaction value per region
-        f.write("Avg Transaction Value per Region:\n")
-        for region, stats in region_stats.items():
-            avg_val = stats['total_sales'] / stats['transaction_count'] if stats['transaction_count'] else 0
-            f.write(f"  - {region}: ${avg_val:,.2f}\n")
-        f.write("\n")
+    # Compare rounded revenue in date order, as daily_sales_trend output
+    # would, so ties resolve to the same (earliest) day
+    date, peak_revenue = max(sorted(revenue.items()), key=lambda item: round(item[1], 2))
+    
+    return (date, round(peak_revenue, 2), count[date])
+
+SalesStats = namedtuple('SalesStats', [
+    'total_revenue',
+    'region_stats',
+    'all_products',
+    'top_products',
+    'customer_stats',
+    'daily_stats',
+    'peak_day'
+])
+
+# Every field the fused pass needs, extracted with a single call per row
+_ALL_FIELDS = itemgetter('Quantity', 'UnitPrice', 'Region', 'ProductName', 'CustomerID', 'Date')
+
+def compute_all_stats(transactions, n=5):
+    """
+    Computes every analysis in a single pass over transactions
+    
+    Gives the same results as calling calculate_total_revenue,
+    region_wise_sales, top_selling_products, customer_analysis,
+    daily_sales_trend and find_peak_sales_day one after another.
+    
+    Returns: SalesStats named tuple
+    (all_products is the full unsorted product list, top_products its top n)
+    """
+    total_revenue = 0
+    region_agg = defaultdict(_new_region_entry)
+    product_agg = defaultdict(_new_product_entry)
+    customer_agg = defaultdict(_new_customer_entry)
+    daily_agg = defaultdict(_new_daily_entry)
+    
+    for qty, price, region, p_name, c_id, date in map(_ALL_FIELDS, transactions):
+        amount = qty * price
+        total_revenue += amount
         
-        # 8. API ENRICHMENT SUMMARY
-        f.write("API ENRICHMENT SUMMARY\n")
-        f.write("------------------------------------------\n")
+        stats = region_agg[region]
+        stats[0] += amount
+        stats[1] += 1
         
-        total_enriched = sum(1 for t in enriched_transactions if t.get('enriched', False))
-        success_rate = (total_enriched / len(transactions)) * 100 if transactions else 0
+        stats = product_agg[p_name]
+        stats[0] += qty
+        stats[1] += amount
         
-        f.write(f"Total Products Enriched: {total_enriched}\n")
-        f.write(f"Success Rate:            {success_rate:.2f}%\n")
-        f.write("Unenriched Products (Sample IDs):\n")
+        stats = customer_agg[c_id]
+        stats[0] += amount
+        stats[1] += 1
+        stats[2].add(p_name)
         
-        unenriched_ids = set()
-        for t in enriched_transactions:
-            if not t.get('enriched', False):
-                unenriched_ids.add(t['ProductID'])
+        stats = daily_agg[date]
+        stats[0] += amount
+        stats[1] += 1
+        stats[2].add(c_id)
         
-        for pid in list(unenriched_ids)[:10]: # Limit sample to 10
-            f.write(f"  - {pid}\n")
+    all_products = _product_list(product_agg)
+    daily_stats = _finalize_daily_stats(daily_agg)
+    
+    return SalesStats(
+        total_revenue=total_revenue,
+        region_stats=_finalize_region_stats(region_agg),
+        all_products=all_products,
+        top_products=_rank_products(all_products, n),
+        customer_stats=_finalize_customer_stats(customer_agg),
+        daily_stats=daily_stats,
+        peak_day=_peak_from_daily_stats(daily_stats)
+    )
+
+def generate_sales_report(transactions, enriched_transactions, output_file='output/sales_report.txt', stats=None):
+    """
+    Generates a comprehensive formatted text report
+    
+    Parameters: stats - optional SalesStats from compute_all_stats(transactions)
+    that the caller already has; computed here when omitted
+    """
+    # Ensure output directory exists
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    
+    # One pass over transactions feeds every section below,
+    # skipped entirely when the caller hands its results in
+    all_stats = stats if stats is not None else compute_all_stats(transactions, n=5)
+    
+    # Build the report in memory and write it with a single call,
+    # rather than issuing one small f.write() per line
+    parts = []
+    append = parts.append
+    
+    # 1. HEADER
+    append("==========================================\n")
+    append("          SALES ANALYTICS REPORT\n")
+    append(f"          Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    append(f"          Records Processed: {len(transactions)}\n")
+    append("==========================================\n\n")
+    
+    # 2. OVERALL SUMMARY
+    total_revenue = all_stats.total_revenue
+    total_transactions = len(transactions)
+    avg_order_value = total_revenue / total_transactions if total_transactions > 0 else 0
+    
+    # daily_stats is keyed by date in ascending order
+    dates = list(all_stats.daily_stats)
+    date_range = f"{dates[0]} to {dates[-1]}" if dates else "N/A"
+    
+    append("OVERALL SUMMARY\n")
+    append("------------------------------------------\n")
+    append(f"Total Revenue:       ${total_revenue:,.2f}\n")
+    append(f"Total Transactions:  {total_transactions}\n")
+    append(f"Average Order Value: ${avg_order_value:,.2f}\n")
+    append(f"Date Range:          {date_range}\n\n")
+    
+    # 3. REGION-WISE PERFORMANCE
+    append("REGION-WISE PERFORMANCE\n")
+    append("------------------------------------------\n")
+    append(f"{'Region':<15} {'Sales':<15} {'% of Total':<15} {'Transactions':<15}\n")
+    region_stats = all_stats.region_stats
+    for region, r_stats in region_stats.items():
+        append(f"{region:<15} ${r_stats['total_sales']:<14,.2f} {r_stats['percentage']:<14}% {r_stats['transaction_count']:<15}\n")
+    append("\n")
+    
+    # 4. TOP 5 PRODUCTS
+    append("TOP 5 PRODUCTS\n")
+    append("------------------------------------------\n")
+    append(f"{'Rank':<5} {'Product Name':<30} {'Quantity':<10} {'Revenue':<15}\n")
+    # Ranked here rather than taken from all_stats.top_products, whose
+    # length is whatever n the caller passed to compute_all_stats
+    top_products = _rank_products(all_stats.all_products, 5)
+    for i, (name, qty, rev) in enumerate(top_products, 1):
+        append(f"{i:<5} {name:<30} {qty:<10} ${rev:<15,.2f}\n")
+    append("\n")
+    
+    # 5. TOP 5 CUSTOMERS
+    append("TOP 5 CUSTOMERS\n")
+    append("------------------------------------------\n")
+    append(f"{'Rank':<5} {'Customer ID':<15} {'Total Spent':<20} {'Order Count':<10}\n")
+    cust_stats = all_stats.customer_stats
+    # islice takes the first 5 without copying every customer into a list
+    top_5_customers = list(islice(cust_stats.items(), 5))
+    for i, (c_id, c_stats) in enumerate(top_5_customers, 1):
+        append(f"{i:<5} {c_id:<15} ${c_stats['total_spent']:<19,.2f} {c_stats['purchase_count']:<10}\n")
+    append("\n")
+    
+    # 6. DAILY SALES TREND
+    append("DAILY SALES TREND\n")
+    append("------------------------------------------\n")
+    append(f"{'Date':<15} {'Revenue':<20} {'Transactions':<15} {'Unique Customers':<20}\n")
+    daily_stats = all_stats.daily_stats
+    for date, d_stats in daily_stats.items():
+        append(f"{date:<15} ${d_stats['revenue']:<19,.2f} {d_stats['transaction_count']:<14} {d_stats['unique_customers']:<20}\n")
+    append("\n")
+    
+    # 7. PRODUCT PERFORMANCE ANALYSIS
+    append("PRODUCT PERFORMANCE ANALYSIS\n")
+    append("------------------------------------------\n")
+    
+    # Best selling day
+    peak = all_stats.peak_day
+    best_day_str = f"{peak[0]} (${peak[1]:,.2f} with {peak[2]} txns)" if peak else "N/A"
+    append(f"Best Selling Day: {best_day_str}\n")
+    
+    # Low performing products (bottom 3)
+    # Using logic similar to top_selling but taking bottom
+    low_performers = heapq.nsmallest(3, all_stats.all_products, key=lambda x: x[1])
+    append("Low Performing Products (Bottom 3 by Qty):\n")
+    for name, qty, _ in low_performers:
+        append(f"  - {name}: {qty} units\n")
         
-        if len(unenriched_ids) > 10:
-            f.write(f"  ... (+{len(unenriched_ids)-10} more)\n")
+    # Avg transaction value per region
+    append("Avg Transaction Value per Region:\n")
+    for region, r_stats in region_stats.items():
+        avg_val = r_stats['total_sales'] / r_stats['transaction_count'] if r_stats['transaction_count'] else 0
+        append(f"  - {region}: ${avg_val:,.2f}\n")
+    append("\n")
+    
+    # 8. API ENRICHMENT SUMMARY
+    append("API ENRICHMENT SUMMARY\n")
+    append("------------------------------------------\n")
+    
+    total_enriched = sum(1 for t in enriched_transactions if t.get('enriched', False))
+    success_rate = (total_enriched / len(transactions)) * 100 if transactions else 0
+    
+    append(f"Total Products Enriched: {total_enriched}\n")
+    append(f"Success Rate:            {success_rate:.2f}%\n")
+    append("Unenriched Products (Sample IDs):\n")
+    
+    unenriched_ids = set()
+    for t in enriched_transactions:
+        if not t.get('enriched', False):
+            unenriched_ids.add(t['ProductID'])
+    
+    for pid in list(unenriched_ids)[:10]: # Limit sample to 10
+        append(f"  - {pid}\n")
+    
+    if len(unenriched_ids) > 10:
+        append(f"  ... (+{len(unenriched_ids)-10} more)\n")
+    
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(''.join(parts))
             
     print(f"Report successfully generated at: {output_file}")
@@ -1,4 +1,52 @@
 
+import codecs
+import math
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from operator import itemgetter
+from sys import intern
+
+def iter_clean_lines(filename, encoding='utf-8'):
+    """
+    Streams the data lines of a sales file, one at a time
+    
+    Lines are stripped, empty lines are dropped and the header row is
+    skipped, so only O(1) lines are held in memory. Raises
+    FileNotFoundError / UnicodeDecodeError from the underlying file.
+    
+    Returns: generator of raw lines (strings)
+    """
+    with open(filename, 'r', encoding=encoding) as f:
+        # Filter out empty lines and strip whitespace
+        # Requirement says "Remove empty lines"
+        cleaned_lines = filter(None, map(str.strip, f))
+        
+        # Skip header row (assuming first row is always header if file is valid)
+        next(cleaned_lines, None)
+        
+        yield from cleaned_lines
+
+def _sniff_encoding(filename, encodings, sample_size=65536):
+    """
+    Picks the encoding to read a file with from a prefix of its bytes
+    
+    Returns: the first of encodings that decodes the first sample_size
+    bytes of the file, or None if none of them does
+    """
+    with open(filename, 'rb') as f:
+        head = f.read(sample_size)
+        
+    for encoding in encodings:
+        try:
+            # Incremental (non-final) decode, so a multi-byte character
+            # cut off at the end of the sample is not an error
+            codecs.getincrementaldecoder(encoding)().decode(head)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+            
+    return None
+
 def read_sales_data(filename):
     """
     Reads sales data from file handling encoding issues
@@ -7,39 +55,131 @@ def read_sales_data(filename):
     """
     encodings_to_try = ['utf-8', 'latin-1', 'cp1252']
     
-    for encoding in encodings_to_try:
-        try:
-            with open(filename, 'r', encoding=encoding) as f:
-                lines = f.readlines()
+    try:
+        # Choose the encoding from the file's first 64 KB rather than
+        # decoding the whole file with each encoding in turn
+        encoding = _sniff_encoding(filename, encodings_to_try)
+    except FileNotFoundError:
+        print(f"Error: The file '{filename}' was not found.")
+        return []
+        
+    if encoding is not None:
+        # Undecodable bytes can still appear past the sample, so keep
+        # the cascade from the sniffed encoding onwards as a fallback
+        for encoding in encodings_to_try[encodings_to_try.index(encoding):]:
+            try:
+                # Build the result list straight from the file stream, rather
+                # than readlines() followed by a second, cleaned copy
+                return list(iter_clean_lines(filename, encoding))
                 
-            # Filter out empty lines and strip whitespace
-            # Requirement says "Remove empty lines"
-            cleaned_lines = [line.strip() for line in lines if line.strip()]
-            
-            # Skip header row (assuming first row is always header if file is valid)
-            if cleaned_lines:
-                return cleaned_lines[1:]
-            return []
-            
-        except UnicodeDecodeError:
-            continue
-        except FileNotFoundError:
-            print(f"Error: The file '{filename}' was not found.")
-            return []
+            except UnicodeDecodeError:
+                continue
+            except FileNotFoundError:
+                print(f"Error: The file '{filename}' was not found.")
+                return []
             
     print(f"Error: Could not decode file '{filename}' with any of the attempted encodings.")
     return []
 
-def parse_transactions(raw_lines):
+def read_sales_data_many(filenames, max_workers=8):
+    """
+    Reads several sales files concurrently
+    
+    Each file goes through read_sales_data on a worker thread; the GIL is
+    released while a thread waits on disk, so the reads overlap.
+    
+    Returns: list of raw-line lists, in the same order as filenames
+    """
+    filenames = list(filenames)
+    
+    if len(filenames) < 2:
+        return [read_sales_data(filename) for filename in filenames]
+        
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(filenames))) as executor:
+        return list(executor.map(read_sales_data, filenames))
+
+# Below this many lines a process pool costs more than it saves
+_PARALLEL_MIN_LINES = 200000
+
+# Columns _parse_lines interns (every one but TransactionID)
+_INTERNED_FIELDS = ('Date', 'ProductID', 'ProductName', 'CustomerID', 'Region')
+
+def parse_transactions(raw_lines, workers=1):
     """
     Parses raw lines into clean list of dictionaries
     
+    Parameters: raw_lines - any iterable of lines, e.g. read_sales_data()
+    output or iter_clean_lines(filename) to parse while streaming the file
+    workers - number of processes to parse large inputs with; the
+    default of 1 parses in this process
+    
     Returns: list of dictionaries with keys:
     ['TransactionID', 'Date', 'ProductID', 'ProductName', 
      'Quantity', 'UnitPrice', 'CustomerID', 'Region']
     """
+    if workers > 1:
+        raw_lines = raw_lines if isinstance(raw_lines, list) else list(raw_lines)
+        if len(raw_lines) >= _PARALLEL_MIN_LINES:
+            return _parse_in_processes(raw_lines, workers)
+            
+    return _parse_lines(raw_lines)
+
+def _parse_in_processes(raw_lines, workers):
+    """
+    Parses contiguous slices of raw_lines on a process pool
+    
+    Results come back in slice order, so row order matches a serial
+    parse. Rows are pickled back to this process, which is serial work
+    of roughly half the parse itself, so the gain needs several cores.
+    Unpickled strings are fresh objects, so the repeating columns are
+    re-interned here to keep the one-object-per-value property.
+    
+    Returns: list of dictionaries, as parse_transactions
+    """
+    chunk_size = -(-len(raw_lines) // workers)
+    chunks = [raw_lines[i:i + chunk_size] for i in range(0, len(raw_lines), chunk_size)]
+    
+    transactions = []
+    # Use the platform's default start method rather than forcing fork,
+    # which CPython moved away from on macOS (and on Linux from 3.14)
+    # because forking is unsafe with live threads and some system libraries
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        for chunk_transactions in executor.map(_parse_lines, chunks):
+            for t in chunk_transactions:
+                for key in _INTERNED_FIELDS:
+                    t[key] = intern(t[key])
+            transactions.extend(chunk_transactions)
+            
+    return transactions
+
+def _clean_field(cache, raw):
+    """Strips and interns raw, remembering the result in cache"""
+    value = cache[raw] = intern(raw.strip())
+    return value
+
+def _clean_product_name(cache, raw):
+    """As _clean_field, also replacing commas in the product name"""
+    value = cache[raw] = intern(raw.replace(',', ' ').strip())
+    return value
+
+def _parse_lines(raw_lines):
+    """
+    Parses raw lines into transaction dictionaries in this process
+    
+    Returns: list of dictionaries, as parse_transactions
+    """
     transactions = []
     
+    # Everything but TransactionID repeats across many rows, so cleaned
+    # values are memoized by their raw text: a repeat costs one dict
+    # lookup instead of strip() + intern(). Interning makes every row
+    # share one string object per value, which saves memory and lets the
+    # analytics' dict lookups match by identity.
+    cleaned = {}
+    cleaned_names = {}
+    get_cleaned = cleaned.get
+    get_cleaned_name = cleaned_names.get
+    
     for line in raw_lines:
         fields = line.split('|')
         
@@ -51,10 +191,6 @@ def parse_transactions(raw_lines):
         # Unpack fields for clarity
         t_id, date, p_id, p_name, qty_str, price_str, c_id, region = fields
         
-        # Clean fields
-        # Requirement: Handle commas within ProductName (remove or replace)
-        clean_p_name = p_name.replace(',', ' ')
-        
         try:
             # Requirement: Remove commas from numeric fields and convert
             clean_qty = int(qty_str.replace(',', ''))
@@ -67,73 +203,140 @@ def parse_transactions(raw_lines):
             # I will skip this row if conversion fails to ensure "clean list of dictionaries"
             continue
 
+        # Clean fields
+        # Requirement: Handle commas within ProductName (remove or replace)
+        # (an empty cleaned value is falsy and just gets recomputed)
         transaction = {
             'TransactionID': t_id.strip(),
-            'Date': date.strip(),
-            'ProductID': p_id.strip(),
-            'ProductName': clean_p_name.strip(),
+            'Date': get_cleaned(date) or _clean_field(cleaned, date),
+            'ProductID': get_cleaned(p_id) or _clean_field(cleaned, p_id),
+            'ProductName': get_cleaned_name(p_name) or _clean_product_name(cleaned_names, p_name),
             'Quantity': clean_qty,
             'UnitPrice': clean_price,
-            'CustomerID': c_id.strip(),
-            'Region': region.strip()
+            'CustomerID': get_cleaned(c_id) or _clean_field(cleaned, c_id),
+            'Region': get_cleaned(region) or _clean_field(cleaned, region)
         }
         
         transactions.append(transaction)
         
     return transactions
 
-def validate_and_filter(transactions, region=None, min_amount=None, max_amount=None):
+# Fields read by the validation rules: numeric values, then required strings
+_VALIDATION_FIELDS = itemgetter(
+    'Quantity', 'UnitPrice',
+    'TransactionID', 'Date', 'ProductID', 'ProductName', 'CustomerID', 'Region'
+)
+
+ValidationResult = namedtuple('ValidationResult', [
+    'valid_transactions',
+    'amounts',
+    'invalid_count',
+    'available_regions',
+    'amount_min',
+    'amount_max'
+])
+
+def validate_transactions(transactions):
     """
-    Validates transactions and applies optional filters
+    Applies the validation rules to every transaction
     
-    Returns: tuple (valid_transactions, invalid_count, filter_summary)
+    Parameters: transactions - any iterable of transaction dictionaries
+    (it is consumed once)
+    
+    Pass the result to validate_and_filter(..., validation=...) to apply
+    several filter views while validating the list only once.
+    
+    Returns: ValidationResult named tuple
+    where amounts[i] is Quantity * UnitPrice of valid_transactions[i],
+    available_regions is sorted, and the amount bounds are None when
+    nothing is valid
     """
     valid_transactions = []
+    amounts = []
     invalid_count = 0
     
-    # 1. Validation
-    temp_valid_transactions = []
+    # Summary info is tracked as rows validate, not in extra passes
+    regions = set()
+    amount_min = math.inf
+    amount_max = -math.inf
+    
+    # Every field a rule looks at comes out of the row in one itemgetter call;
+    # transactions is read once, so any iterable of rows works
     for t in transactions:
-        is_valid = True
+        qty, price, t_id, date, p_id, p_name, c_id, region = _VALIDATION_FIELDS(t)
+        
+        # Each rule rejects the row as soon as it fails, cheapest first,
+        # so invalid rows skip the remaining checks
         
         # Rule: Quantity > 0
-        if t['Quantity'] <= 0:
-            is_valid = False
+        if qty <= 0:
+            invalid_count += 1
+            continue
             
         # Rule: UnitPrice > 0
-        if t['UnitPrice'] <= 0:
-            is_valid = False
+        if price <= 0:
+            invalid_count += 1
+            continue
             
-        # Rule: All required fields must be present
-        # Checking for empty strings as "present" implies having a value
-        required_fields = ['TransactionID', 'Date', 'ProductID', 'ProductName', 'CustomerID', 'Region']
-        for field in required_fields:
-            if not t[field]: # Empty string check
-                is_valid = False
-                break
-                
         # Rule: IDs must start with correct letters
-        if not t['TransactionID'].startswith('T'):
-            is_valid = False
-        if not t['ProductID'].startswith('P'):
-            is_valid = False
-        if not t['CustomerID'].startswith('C'):
-            is_valid = False
+        # (a one-char slice compare skips the startswith method call;
+        # ''[:1] is '' so empty IDs fail here too)
+        if t_id[:1] != 'T' or p_id[:1] != 'P' or c_id[:1] != 'C':
+            invalid_count += 1
+            continue
             
-        if is_valid:
-            temp_valid_transactions.append(t)
-        else:
+        # Rule: All required fields must be present
+        # Checking for empty strings as "present" implies having a value;
+        # the three IDs are known non-empty from the prefix rule above
+        if not (date and p_name and region):
             invalid_count += 1
+            continue
+            
+        amount = qty * price
+        valid_transactions.append(t)
+        amounts.append(amount)
+        regions.add(region)
+        amount_min = amount if amount < amount_min else amount_min
+        amount_max = amount if amount > amount_max else amount_max
+            
+    if not valid_transactions:
+        amount_min = amount_max = None
+        
+    return ValidationResult(
+        valid_transactions=valid_transactions,
+        amounts=amounts,
+        invalid_count=invalid_count,
+        available_regions=sorted(regions),
+        amount_min=amount_min,
+        amount_max=amount_max
+    )
+
+def validate_and_filter(transactions, region=None, min_amount=None, max_amount=None, validation=None):
+    """
+    Validates transactions and applies optional filters
+    
+    Parameters: region - a single region name, or a collection of names
+    to keep any of them (e.g. {'North', 'East'})
+    validation - optional ValidationResult from
+    validate_transactions(transactions) that the caller already has;
+    computed here when omitted. It must describe these transactions as
+    they are now, so recompute it after modifying the list or its rows.
+    
+    Returns: tuple (valid_transactions, invalid_count, filter_summary)
+    """
+    # 1. Validation, skipped when the caller hands its result in
+    if validation is None:
+        validation = validate_transactions(transactions)
+    (temp_valid_transactions, amounts, invalid_count,
+     available_regions, amount_min, amount_max) = validation
             
     # 2. Display Info (as per requirements)
     # "Print available regions to user before filtering"
-    available_regions = sorted(list(set(t['Region'] for t in temp_valid_transactions if t['Region'])))
     print(f"Available Regions: {available_regions}")
     
     # "Print transaction amount range (min/max) to user"
-    amounts = [t['Quantity'] * t['UnitPrice'] for t in temp_valid_transactions]
-    if amounts:
-        print(f"Transaction Amount Range: Min={min(amounts)}, Max={max(amounts)}")
+    if temp_valid_transactions:
+        print(f"Transaction Amount Range: Min={amount_min}, Max={amount_max}")
     else:
         print("Transaction Amount Range: N/A (no valid transactions)")
 
@@ -158,37 +361,44 @@ def validate_and_filter(transactions, region=None, min_amount=None, max_amount=N
     # If 20 were filtered by region and 10 by amount, 95 - 20 - 10 = 65.
     # So it likely means "Number of records REMOVED by this filter".
     
-    initial_valid_count = len(temp_valid_transactions)
-    current_transactions = temp_valid_transactions
-    
-    # Filter by Region
-    if region:
-        next_transactions = [t for t in current_transactions if t['Region'] == region]
-        filtered_by_region_count = len(current_transactions) - len(next_transactions)
-        current_transactions = next_transactions
-        print(f"Records after region filter: {len(current_transactions)}")
-    
-    # Filter by Amount
-    # min_amount and max_amount check "Quantity * UnitPrice"
-    if min_amount is not None or max_amount is not None:
-        next_transactions = []
-        for t in current_transactions:
-            amount = t['Quantity'] * t['UnitPrice']
-            passed = True
-            if min_amount is not None and amount < min_amount:
-                passed = False
-            if max_amount is not None and amount > max_amount:
-                passed = False
-            
-            if passed:
-                next_transactions.append(t)
-                
-        filtered_by_amount_count = len(current_transactions) - len(next_transactions)
-        current_transactions = next_transactions
-        print(f"Records after amount filter: {len(current_transactions)}")
+    # Normalize the region filter once to a frozenset (O(1) membership);
+    # an empty value means no region filter, as before
+    if not region:
+        allowed_regions = None
+    elif isinstance(region, str):
+        allowed_regions = frozenset((region,))
+    else:
+        allowed_regions = frozenset(region)
         
-    filtered_transactions = current_transactions
+    # Unset amount limits become infinite sentinels, so the loop runs one
+    # comparison chain instead of re-testing for None on every row
+    filter_by_amount = min_amount is not None or max_amount is not None
+    low = -math.inf if min_amount is None else min_amount
+    high = math.inf if max_amount is None else max_amount
+    append = filtered_transactions.append
     
+    # Region and amount filters run in one pass over the valid rows (with
+    # the amounts computed during validation), emitting survivors straight
+    # into the result instead of building an intermediate list per filter
+    for t, amount in zip(temp_valid_transactions, amounts):
+        # Filter by Region
+        if allowed_regions is not None and t['Region'] not in allowed_regions:
+            filtered_by_region_count += 1
+            continue
+            
+        # Filter by Amount
+        # min_amount and max_amount check "Quantity * UnitPrice"
+        if amount < low or amount > high:
+            filtered_by_amount_count += 1
+            continue
+            
+        append(t)
+        
+    if allowed_regions is not None:
+        print(f"Records after region filter: {len(temp_valid_transactions) - filtered_by_region_count}")
+    if filter_by_amount:
+        print(f"Records after amount filter: {len(filtered_transactions)}")
+        
     filter_summary = {
         'total_input': len(transactions),
         'invalid': invalid_count,